@@ -145,11 +145,11 @@ class Parser(DataParser):
             self.DSTrackerUsr = DummyStateTracker(dst_args)
 
             self.informable_slots = \
-                deepcopy(list(self.ontology.ontology['informable'].keys()))
+                list(self.ontology.ontology['informable'].keys())
             self.requestable_slots = \
-                deepcopy(self.ontology.ontology['requestable'] + ['this'])
+                self.ontology.ontology['requestable'] + ['this']
             self.system_requestable_slots = \
-                deepcopy(self.ontology.ontology['system_requestable'])
+                list(self.ontology.ontology['system_requestable'])
 
             self.NActions = \
                 4 + len(self.system_requestable_slots) + \
@@ -68,11 +68,11 @@ class CalculatedPolicy(DialoguePolicy.DialoguePolicy):
 
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'] + ['this'])
+            self.ontology.ontology['requestable'] + ['this']
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
 
         self.dstc2_acts = None
 
@@ -18,7 +18,6 @@ from Domain import Ontology, DataBase
 from Dialogue.Action import DialogueAct, DialogueActItem, Operator
 from Dialogue.State import SlotFillingDialogueState
 from UserSimulator.AgendaBasedUserSimulator.AgendaBasedUS import AgendaBasedUS
-from copy import deepcopy
 
 import numpy as np
 import random
@@ -104,11 +103,18 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
 
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'])
+            list(self.ontology.ontology['requestable'])
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
+
+        # Informable slots the user agent encodes as constraints
+        self.constraint_slots = \
+            [s for s in self.informable_slots if s != 'name']
+
+        self.dstc2_acts_sys = None
+        self.dstc2_acts_usr = None
 
         if not domain:
             # Default to CamRest dimensions
@@ -206,6 +212,26 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
         print('Reinforce {0} DialoguePolicy Number of Actions: {1}'
               .format(self.agent_role, self.NActions))
 
+        # (intent, slot) pairs in action encoding order, used when decoding
+        # actions, and the reverse lookup tables used when encoding them
+        self.sys_actions = \
+            [(a, None) for a in self.dstc2_acts_sys or []] + \
+            [('request', s) for s in self.system_requestable_slots] + \
+            [('inform', s) for s in self.requestable_slots]
+
+        self.usr_actions = \
+            [(a, None) for a in self.dstc2_acts_usr or []] + \
+            [('request', s) for s in self.requestable_slots] + \
+            [('inform', s) for s in self.requestable_slots]
+
+        self.sys_action_ids = {}
+        for (i, a) in enumerate(self.sys_actions):
+            self.sys_action_ids.setdefault(a, i)
+
+        self.usr_action_ids = {}
+        for (i, a) in enumerate(self.usr_actions):
+            self.usr_action_ids.setdefault(a, i)
+
     def initialize(self, **kwargs):
         """
         Initialize internal structures at the beginning of each dialogue
@@ -293,7 +319,7 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
         # Probabilistic policy: Sample from action wrt probabilities
         probs = self.calculate_policy(self.encode_state(state))
 
-        if any(np.isnan(probs)):
+        if np.isnan(probs).any():
             print('WARNING! NAN detected in action probabilities! Selecting '
                   'random action.')
             return self.decode_action(
@@ -302,11 +328,10 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
 
         if self.IS_GREEDY:
             # Get greedy action
-            max_pi = max(probs)
-            maxima = [i for i, j in enumerate(probs) if j == max_pi]
+            maxima = np.flatnonzero(probs == probs.max())
 
             # Break ties randomly
-            if maxima:
+            if maxima.size:
                 sys_acts = \
                     self.decode_action(
                         random.choice(maxima), self.agent_role == 'system')
@@ -340,18 +365,6 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
         out = e_x / e_x.sum()
         return out
 
-    @staticmethod
-    def softmax_gradient(x):
-        """
-        Calculates the gradient of the softmax
-
-        :param x: a number
-        :return: the gradient of the softmax
-        """
-        x = np.asarray(x)
-        x_reshaped = x.reshape(-1, 1)
-        return np.diagflat(x_reshaped) - np.dot(x_reshaped, x_reshaped.T)
-
     def calculate_policy(self, state):
         """
         Calculates the probabilities for each action from the given state
@@ -359,9 +372,7 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
         :param state: the current dialogue state
         :return: probabilities of actions
         """
-        dot_prod = np.dot(state, self.weights)
-        exp_dot_prod = np.exp(dot_prod)
-        return exp_dot_prod / np.sum(exp_dot_prod)
+        return self.softmax(np.dot(state, self.weights))
 
     def train(self, dialogues):
         """
@@ -375,15 +386,21 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
             return
 
         for dialogue in dialogues:
-            discount = self.gamma
-
             if len(dialogue) > 1:
                 dialogue[-2]['reward'] = dialogue[-1]['reward']
 
-            rewards = [t['reward'] for t in dialogue]
+            rewards = np.fromiter((t['reward'] for t in dialogue),
+                                  dtype=float, count=len(dialogue))
             norm_rewards = \
                 (rewards - np.mean(rewards)) / (np.std(rewards) + 0.000001)
 
+            # Encode the whole dialogue up front, skipping turns whose action
+            # cannot be encoded, so that the update loop below only works on
+            # a single (turns x features) state matrix.
+            turn_ids = np.empty(len(dialogue), dtype=int)
+            act_encs = np.empty(len(dialogue), dtype=int)
+            states_enc = np.empty((len(dialogue), self.NStateFeatures))
+            n_turns = 0
             for (t, turn) in enumerate(dialogue):
                 act_enc = self.encode_action(turn['action'],
                                              self.agent_role == 'system')
@@ -399,26 +416,40 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
                                      f'{self.NStateFeatures} != State '
                                      f'Encoding Length: {len(state_enc)}')
 
+                turn_ids[n_turns] = t
+                act_encs[n_turns] = act_enc
+                states_enc[n_turns] = state_enc
+                n_turns += 1
+
+            turn_ids = turn_ids[:n_turns]
+            act_encs = act_encs[:n_turns]
+            states_enc = states_enc[:n_turns]
+
+            # Discount the normalised rewards of all encoded turns at once;
+            # the k-th encoded turn is discounted by gamma^(k+1).
+            returns = norm_rewards[turn_ids] * \
+                self.gamma ** np.arange(1, n_turns + 1)
+
+            for (act_enc, state_enc, ret) in \
+                    zip(act_encs, states_enc, returns):
                 # Calculate the gradients
 
                 # Call policy again to retrieve the probability of the
                 # action taken
                 probabilities = self.calculate_policy(state_enc)
 
-                softmax_deriv = self.softmax_gradient(probabilities)[act_enc]
-                log_policy_grad = softmax_deriv / probabilities[act_enc]
-                gradient = \
-                    np.asarray(
-                        state_enc)[None, :].transpose().dot(
-                        log_policy_grad[None, :])
-                gradient = np.clip(gradient, -1.0, 1.0)
+                # The gradient of log softmax wrt the logits is
+                # onehot(action) - probabilities, so there is no need to
+                # build the full softmax Jacobian and divide it back out.
+                log_policy_grad = -probabilities
+                log_policy_grad[act_enc] += 1
+                gradient = np.outer(state_enc, log_policy_grad)
+                np.clip(gradient, -1.0, 1.0, out=gradient)
 
                 # Train policy
-                self.weights += \
-                    self.alpha * gradient * norm_rewards[t] * discount
-                self.weights = np.clip(self.weights, -1, 1)
-
-                discount *= self.gamma
+                gradient *= self.alpha * ret
+                self.weights += gradient
+                np.clip(self.weights, -1, 1, out=self.weights)
 
         if self.alpha > 0.01:
             self.alpha *= self.alpha_decay_rate
@@ -443,20 +474,18 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
             # need to be communicated and which of them
             # actually have.
             if state.user_goal:
-                for c in self.informable_slots:
-                    if c != 'name':
-                        if c in state.user_goal.constraints:
-                            temp.append(1)
-                        else:
-                            temp.append(0)
-
-                for c in self.informable_slots:
-                    if c != 'name':
-                        if c in state.user_goal.actual_constraints and \
-                                state.user_goal.actual_constraints[c].value:
-                            temp.append(1)
-                        else:
-                            temp.append(0)
+                for c in self.constraint_slots:
+                    if c in state.user_goal.constraints:
+                        temp.append(1)
+                    else:
+                        temp.append(0)
+
+                for c in self.constraint_slots:
+                    if c in state.user_goal.actual_constraints and \
+                            state.user_goal.actual_constraints[c].value:
+                        temp.append(1)
+                    else:
+                        temp.append(0)
 
                 for r in self.requestable_slots:
                     if r in state.user_goal.requests:
@@ -506,32 +535,15 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
             return -1
 
         action = actions[0]
+        action_ids = self.sys_action_ids if system else self.usr_action_ids
 
-        if system:
-            if self.dstc2_acts_sys and action.intent in self.dstc2_acts_sys:
-                return self.dstc2_acts_sys.index(action.intent)
-
-            if action.intent == 'request':
-                return len(self.dstc2_acts_sys) + \
-                       self.system_requestable_slots.index(
-                           action.params[0].slot)
-
-            if action.intent == 'inform':
-                return len(self.dstc2_acts_sys) + \
-                       len(self.system_requestable_slots) + \
-                       self.requestable_slots.index(action.params[0].slot)
-        else:
-            if self.dstc2_acts_usr and action.intent in self.dstc2_acts_usr:
-                return self.dstc2_acts_usr.index(action.intent)
+        act_enc = action_ids.get((action.intent, None))
 
-            if action.intent == 'request':
-                return len(self.dstc2_acts_usr) + \
-                       self.requestable_slots.index(action.params[0].slot)
+        if act_enc is None and action.params:
+            act_enc = action_ids.get((action.intent, action.params[0].slot))
 
-            if action.intent == 'inform':
-                return len(self.dstc2_acts_usr) + \
-                       len(self.requestable_slots) + \
-                       self.requestable_slots.index(action.params[0].slot)
+        if act_enc is not None:
+            return act_enc
 
         # Default fall-back action
         print('Reinforce ({0}) policy action encoder warning: Selecting '
@@ -551,53 +563,16 @@ class ReinforcePolicy(DialoguePolicy.DialoguePolicy):
         :return: the decoded action
         """
 
-        if system:
-            if action_enc < len(self.dstc2_acts_sys):
-                return [DialogueAct(self.dstc2_acts_sys[action_enc], [])]
-
-            if action_enc < len(self.dstc2_acts_sys) + \
-                    len(self.system_requestable_slots):
-                return [DialogueAct(
-                    'request',
-                    [DialogueActItem(
-                        self.system_requestable_slots[
-                            action_enc - len(self.dstc2_acts_sys)],
-                        Operator.EQ, '')])]
-
-            if action_enc < len(self.dstc2_acts_sys) + \
-                    len(self.system_requestable_slots) + \
-                    len(self.requestable_slots):
-                index = action_enc - len(self.dstc2_acts_sys) - \
-                        len(self.system_requestable_slots)
-                return [DialogueAct(
-                    'inform',
-                    [DialogueActItem(
-                        self.requestable_slots[index], Operator.EQ, '')])]
+        actions = self.sys_actions if system else self.usr_actions
 
-        else:
-            if action_enc < len(self.dstc2_acts_usr):
-                return [DialogueAct(self.dstc2_acts_usr[action_enc], [])]
-
-            if action_enc < len(self.dstc2_acts_usr) + \
-                    len(self.requestable_slots):
-                return [DialogueAct(
-                    'request',
-                    [DialogueActItem(
-                        self.requestable_slots[
-                            action_enc - len(self.dstc2_acts_usr)],
-                        Operator.EQ,
-                        '')])]
-
-            if action_enc < len(self.dstc2_acts_usr) + \
-                    2 * len(self.requestable_slots):
-                return [DialogueAct(
-                    'inform',
-                    [DialogueActItem(
-                        self.requestable_slots[
-                            action_enc - len(self.dstc2_acts_usr) -
-                            len(self.requestable_slots)],
-                        Operator.EQ,
-                        '')])]
+        if 0 <= action_enc < len(actions):
+            intent, slot = actions[action_enc]
+
+            if slot is None:
+                return [DialogueAct(intent, [])]
+
+            return [DialogueAct(
+                intent, [DialogueActItem(slot, Operator.EQ, '')])]
 
         # Default fall-back action
         print('Reinforce DialoguePolicy ({0}) policy action decoder warning: '
@@ -18,7 +18,6 @@ from Domain import Ontology, DataBase
 from Dialogue.Action import DialogueAct, DialogueActItem, Operator
 from Dialogue.State import SlotFillingDialogueState
 from UserSimulator.AgendaBasedUserSimulator.AgendaBasedUS import AgendaBasedUS
-from copy import deepcopy
 
 import tensorflow as tf
 import numpy as np
@@ -81,12 +80,11 @@ class SupervisedPolicy(DialoguePolicy.DialoguePolicy):
 
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'] +
-                     ['this', 'signature'])
+            self.ontology.ontology['requestable'] + ['this', 'signature']
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
 
         self.dstc2_acts = None
 
@@ -15,8 +15,6 @@ from Domain import Ontology
 from DialogueManagement.DialoguePolicy import DialoguePolicy
 from Dialogue.Action import DialogueAct, DialogueActItem, Operator
 
-from copy import deepcopy
-
 import random
 
 """
@@ -88,7 +86,7 @@ class HandcraftedPolicy(DialoguePolicy.DialoguePolicy):
 
         # Try to fill slots
         requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
 
         if not hasattr(dialogue_state, 'requestable_slot_entropies') or \
                 not dialogue_state.requestable_slot_entropies:
@@ -19,8 +19,6 @@ from UserSimulator.AgendaBasedUserSimulator.AgendaBasedUS import AgendaBasedUS
 
 from scipy.optimize import linprog
 
-from copy import deepcopy
-
 import pickle
 import random
 import pprint
@@ -120,11 +118,11 @@ class MinimaxQPolicy(DialoguePolicy.DialoguePolicy):
         
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'])
+            list(self.ontology.ontology['requestable'])
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
         
         if self.dstc2_acts_sys:
             if self.agent_role == 'system':
@@ -16,7 +16,6 @@ from Dialogue.Action import DialogueAct, DialogueActItem, Operator
 from UserSimulator.AgendaBasedUserSimulator.AgendaBasedUS import AgendaBasedUS
 from Domain.Ontology import Ontology
 from Domain.DataBase import DataBase
-from copy import deepcopy
 
 import pickle
 import random
@@ -94,11 +93,11 @@ class QPolicy(DialoguePolicy.DialoguePolicy):
 
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'])
+            list(self.ontology.ontology['requestable'])
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
 
         self.dstc2_acts = None
 
@@ -17,8 +17,6 @@ from Domain.Ontology import Ontology
 from Domain.DataBase import DataBase
 from UserSimulator.AgendaBasedUserSimulator.AgendaBasedUS import AgendaBasedUS
 
-from copy import deepcopy
-
 import pickle
 import random
 import pprint
@@ -123,11 +121,11 @@ class WoLFPHCPolicy(DialoguePolicy.DialoguePolicy):
 
         # Extract lists of slots that are frequently used
         self.informable_slots = \
-            deepcopy(list(self.ontology.ontology['informable'].keys()))
+            list(self.ontology.ontology['informable'].keys())
         self.requestable_slots = \
-            deepcopy(self.ontology.ontology['requestable'])
+            list(self.ontology.ontology['requestable'])
         self.system_requestable_slots = \
-            deepcopy(self.ontology.ontology['system_requestable'])
+            list(self.ontology.ontology['system_requestable'])
 
         if self.dstc2_acts_sys:
             if self.agent_role == 'system':
@@ -171,6 +171,26 @@ class DummyNLU(NLU):
         punctuation += '.'
         self.punctuation_remover = str.maketrans('', '', punctuation)
 
+        # Compiled word-boundary regexes, keyed by pattern (see match_pattern)
+        self.pattern_regexes = {}
+
+    def match_pattern(self, pattern, utterance):
+        """
+        Search for a pattern, delimited by word boundaries, in the utterance.
+        Each pattern's regex is compiled once and reused on later calls.
+
+        :param pattern: the pattern to look for
+        :param utterance: the (preprocessed) utterance to search in
+        :return: the match object, or None if the pattern was not found
+        """
+        regex = self.pattern_regexes.get(pattern)
+
+        if regex is None:
+            regex = re.compile(r'\b{0}\b'.format(pattern))
+            self.pattern_regexes[pattern] = regex
+
+        return regex.search(utterance)
+
     def initialize(self, args):
         """
         Nothing to do here.
@@ -253,7 +273,7 @@ class DummyNLU(NLU):
 
         # Check for dialogue ending
         for p in self.bye_pattern:
-            match = re.search(r'\b{0}\b'.format(p), utterance)
+            match = self.match_pattern(p, utterance)
             if match:
                 dact.intent = 'bye'
                 break
@@ -261,84 +281,84 @@ class DummyNLU(NLU):
         # Search for 'welcome' first because it may contain 'hello'
         if dact.intent == 'UNK':
             for p in self.welcome_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'welcomemsg'
                     break
 
         if dact.intent == 'UNK':
             for p in self.hi_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'hello'
                     break
 
         if dact.intent == 'UNK':
             for p in self.reqalts_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'reqalts'
                     break
 
         if dact.intent == 'UNK':
             for p in self.reqmore_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'reqmore'
                     break
 
         if dact.intent == 'UNK':
             for p in self.repeat_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'repeat'
                     break
 
         if dact.intent == 'UNK':
             for p in self.restart_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'restart'
                     break
 
         if dact.intent == 'UNK':
             for p in self.thankyou_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'thankyou'
                     break
 
         if dact.intent == 'UNK':
             for p in self.request_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'request'
                     break
 
         if dact.intent == 'UNK':
             for p in self.select_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'select'
                     break
 
         if dact.intent == 'UNK':
             for p in self.confirm_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'confirm'
                     break
 
         if dact.intent == 'UNK':
             for p in self.expl_conf_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'expl-conf'
                     break
 
         if dact.intent == 'UNK':
             for p in self.cant_help_pattern:
-                match = re.search(r'\b{0}\b'.format(p), utterance)
+                match = self.match_pattern(p, utterance)
                 if match:
                     dact.intent = 'canthelp'
                     dact.params = []
@@ -404,7 +424,7 @@ class DummyNLU(NLU):
                     found = False
 
                     for p in self.ontology.ontology['informable'][word]:
-                        match = re.search(r'\b{0}\b'.format(p), utterance)
+                        match = self.match_pattern(p, utterance)
                         if match:
                             if word == 'name':
                                 dact.intent = 'offer'
@@ -419,7 +439,7 @@ class DummyNLU(NLU):
                     if not found:
                         # Search for dontcare (e.g. I want any area)
                         for p in self.dontcare_pattern:
-                            match = re.search(r'\b{0}\b'.format(p), utterance)
+                            match = self.match_pattern(p, utterance)
                             if match:
                                 dact.intent = 'inform'
                                 dact.params.append(
@@ -479,7 +499,7 @@ class DummyNLU(NLU):
                         # We can only handle 'dontcare' kind of values here,
                         # as we do not know values of req. slots.
                         for p in self.dontcare_pattern:
-                            match = re.search(r'\b{0}\b'.format(p), utterance)
+                            match = self.match_pattern(p, utterance)
                             if match:
                                 dact.params = \
                                     [DialogueActItem(